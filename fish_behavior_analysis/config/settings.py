@@ -20,6 +20,10 @@ class Config:
     results_dir: str = "results"
     angle_sample_size: int = 1000
     sudden_change_threshold: float = 5.0
+    # Downscale factor applied to frames before dense flow; behavioral
+    # statistics don't need sub-pixel accuracy at full resolution, and
+    # flow cost scales with pixel count. Set to 1.0 for full resolution.
+    flow_input_scale: float = 0.5
     
     # Visualization settings
     plot_figsize: tuple = (10, 6)
@@ -29,6 +33,8 @@ class Config:
         """Initialize default flow parameters if not provided."""
         if self.flow_params is None:
             self.flow_params = {
+                'algo': 'dis',
+                'dis_preset': 'fast',
                 'pyr_scale': 0.5,
                 'levels': 3,
                 'winsize': 15,
@@ -53,6 +59,7 @@ class Config:
             'results_dir': self.results_dir,
             'angle_sample_size': self.angle_sample_size,
             'sudden_change_threshold': self.sudden_change_threshold,
+            'flow_input_scale': self.flow_input_scale,
             'plot_figsize': self.plot_figsize,
             'plot_dpi': self.plot_dpi
         }
\ No newline at end of file
@@ -1,211 +1,484 @@
-"""Main analyzer class combining all functionality."""
-
-import os
-import json
-import numpy as np
-import pandas as pd
-import cv2
-from typing import Dict, List, Tuple, Optional
-import logging
-
-from .frame_extractor import FrameExtractor
-from .flow_processor import OpticalFlowProcessor
-from ..utils.visualization import FlowVisualizer
-from ..utils.file_utils import ResultsExporter
-from ..config.settings import Config
-
-logger = logging.getLogger(__name__)
-
-class FishBehaviorAnalyzer:
-    """Main class for fish behavior analysis."""
-    
-    def __init__(self, video_path: str, config: Optional[Config] = None):
-        """
-        Initialize fish behavior analyzer.
-        
-        Args:
-            video_path: Path to input video
-            config: Configuration object (uses defaults if None)
-        """
-        self.video_path = video_path
-        self.config = config or Config()
-        
-        # Initialize components
-        self.frame_extractor = FrameExtractor(
-            video_path, 
-            self.config.frame_skip, 
-            self.config.frames_dir
-        )
-        self.flow_processor = OpticalFlowProcessor(
-            self.config.frames_dir,
-            self.config.flow_vis_dir
-        )
-        self.visualizer = FlowVisualizer()
-        self.exporter = ResultsExporter(self.config.results_dir)
-        
-        # Analysis results
-        self.analysis_results = {}
-    
-    def extract_frames(self, force_reextract: bool = False) -> int:
-        """Extract frames from video."""
-        return self.frame_extractor.extract_frames(force_reextract)
-    
-    def compute_optical_flow(self, visualize: bool = False, save_vis: bool = True) -> int:
-        """Compute optical flow between frames."""
-        return self.flow_processor.compute_optical_flow(visualize, save_vis)
-    
-    def analyze_behavior(self) -> Dict:
-        """
-        Analyze fish behavior patterns from optical flow.
-        
-        Returns:
-            Dictionary containing analysis results
-        """
-        logger.info("Analyzing fish behavior patterns...")
-        
-        frame_files = self.flow_processor._get_frame_files()
-        if len(frame_files) < 2:
-            raise ValueError("Not enough frames for analysis.")
-        
-        avg_speeds = []
-        all_angles = []
-        sudden_changes = []
-        heatmap = None
-        
-        for i in range(1, len(frame_files)):
-            # Load frames
-            frame = cv2.imread(frame_files[i])
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            prev_gray = cv2.cvtColor(
-                cv2.imread(frame_files[i - 1]), 
-                cv2.COLOR_BGR2GRAY
-            )
-            
-            # Compute flow
-            flow, magnitude = self.flow_processor.compute_flow_between_frames(
-                prev_gray, gray
-            )
-            
-            # Analyze speed
-            avg_speed = np.mean(magnitude)
-            avg_speeds.append(avg_speed)
-            
-            # Analyze directions (memory-efficient sampling)
-            _, angle = cv2.cartToPolar(flow[..., 0], flow[..., 1])
-            angle_flat = angle.flatten()
-            sample_size = min(self.config.angle_sample_size, len(angle_flat))
-            sample_indices = np.random.choice(
-                len(angle_flat), size=sample_size, replace=False
-            )
-            sampled_angles = angle_flat[sample_indices]
-            all_angles.extend(sampled_angles)
-            
-            # Build heatmap
-            if heatmap is None:
-                heatmap = magnitude.copy()
-            else:
-                heatmap += magnitude
-            
-            # Detect sudden changes
-            if i > 1:
-                speed_diff = abs(avg_speeds[-1] - avg_speeds[-2])
-                if speed_diff > self.config.sudden_change_threshold:
-                    sudden_changes.append({
-                        'frame': i,
-                        'speed_change': speed_diff,
-                        'description': 'Possible snapping/grazing behavior'
-                    })
-                    logger.info(f"Sudden change detected at frame {i}!")
-        
-        # Store results
-        self.analysis_results = {
-            'avg_speeds': avg_speeds,
-            'angles': all_angles,
-            'sudden_changes': sudden_changes,
-            'heatmap': heatmap,
-            'metadata': {
-                'video_path': self.video_path,
-                'frame_skip': self.config.frame_skip,
-                'frames_analyzed': len(avg_speeds),
-                'sudden_changes_count': len(sudden_changes)
-            }
-        }
-        
-        logger.info(f"Analysis complete! Found {len(sudden_changes)} sudden changes.")
-        return self.analysis_results
-    
-    def visualize_results(self, show_plots: bool = True, save_plots: bool = True):
-        """Visualize analysis results."""
-        if not self.analysis_results:
-            raise ValueError("No analysis results available. Run analyze_behavior() first.")
-        
-        self.visualizer.plot_speed_timeline(
-            self.analysis_results['avg_speeds'],
-            show=show_plots,
-            save_path=os.path.join(self.config.results_dir, "speed_timeline.png") if save_plots else None
-        )
-        
-        self.visualizer.plot_direction_histogram(
-            self.analysis_results['angles'],
-            show=show_plots,
-            save_path=os.path.join(self.config.results_dir, "direction_histogram.png") if save_plots else None
-        )
-        
-        self.visualizer.show_movement_heatmap(
-            self.analysis_results['heatmap'],
-            show=show_plots,
-            save_path=os.path.join(self.config.results_dir, "movement_heatmap.png") if save_plots else None
-        )
-    
-    def export_results(self) -> Dict[str, str]:
-        """Export analysis results to files."""
-        if not self.analysis_results:
-            raise ValueError("No analysis results available. Run analyze_behavior() first.")
-        
-        return self.exporter.export_all(self.analysis_results)
-    
-    def run_full_analysis(self, 
-                         force_reextract: bool = False,
-                         visualize_flow: bool = False,
-                         show_plots: bool = True,
-                         save_results: bool = True) -> Dict:
-        """
-        Run complete analysis pipeline.
-        
-        Args:
-            force_reextract: Force frame re-extraction
-            visualize_flow: Show optical flow in real-time
-            show_plots: Display analysis plots
-            save_results: Save all results to disk
-            
-        Returns:
-            Analysis results dictionary
-        """
-        logger.info("Starting full fish behavior analysis pipeline...")
-        
-        # Step 1: Extract frames
-        logger.info("Step 1: Extracting frames...")
-        frame_count = self.extract_frames(force_reextract)
-        logger.info(f"Frame extraction complete. {frame_count} frames available.")
-        
-        # Step 2: Compute optical flow
-        logger.info("Step 2: Computing optical flow...")
-        flow_count = self.compute_optical_flow(visualize_flow, save_results)
-        logger.info(f"Optical flow computation complete. {flow_count} flows computed.")
-        
-        # Step 3: Analyze behavior
-        logger.info("Step 3: Analyzing behavior patterns...")
-        results = self.analyze_behavior()
-        
-        # Step 4: Visualize results
-        logger.info("Step 4: Generating visualizations...")
-        self.visualize_results(show_plots, save_results)
-        
-        # Step 5: Export results
-        if save_results:
-            logger.info("Step 5: Exporting results...")
-            export_paths = self.export_results()
-            logger.info(f"Results exported to: {export_paths}")
-        
-        logger.info("Full analysis pipeline complete!")
+"""Main analyzer class combining all functionality."""
+
+import os
+import json
+import multiprocessing
+import numpy as np
+import pandas as pd
+import cv2
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Optional
+import logging
+
+from .frame_extractor import FrameExtractor
+from .flow_processor import OpticalFlowProcessor
+from ..utils.visualization import FlowVisualizer
+from ..utils.file_utils import ResultsExporter
+from ..config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+def _load_gray(path: str, scale: float = 1.0) -> np.ndarray:
+    """Load a frame as grayscale, fusing decode and color conversion."""
+    gray = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    return _scale_gray(gray, scale)
+
+def _scale_gray(gray: np.ndarray, scale: float) -> np.ndarray:
+    """Downscale a grayscale frame for flow input; no-op at scale 1.0."""
+    if scale == 1.0:
+        return gray
+    return cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+def _pair_stats(processor: OpticalFlowProcessor, sample_size: int,
+                prev_gray: np.ndarray, gray: np.ndarray,
+                scale: float = 1.0,
+                rng: Optional[np.random.Generator] = None) -> Tuple:
+    """
+    Compute per-pair flow statistics: mean speed, sampled angles, magnitude.
+
+    Module-level so both the analyzer and worker processes can share it.
+    Inputs are expected to already be downscaled by `scale`; speeds are
+    rescaled back to original-resolution pixels/frame.
+    """
+    flow, magnitude = processor.compute_flow_between_frames(prev_gray, gray)
+
+    # Analyze speed (rescaled to full-resolution pixel units); sumElems is
+    # a single SIMD pass over the magnitude Mat
+    avg_speed = np.float32(cv2.sumElems(magnitude)[0] / magnitude.size / scale)
+
+    # Analyze directions: sample pixel indices first, then compute angles
+    # only for the sampled flow vectors (O(sample) instead of O(H*W))
+    if rng is None:
+        rng = np.random.default_rng()
+    n_pixels = flow.shape[0] * flow.shape[1]
+    sample_size = min(sample_size, n_pixels)
+    sample_indices = rng.integers(0, n_pixels, size=sample_size, dtype=np.int64)
+    sampled_flow = flow.reshape(-1, 2)[sample_indices]
+    sampled_angles = np.arctan2(
+        sampled_flow[:, 1], sampled_flow[:, 0]
+    ).astype(np.float32)
+
+    return avg_speed, sampled_angles, magnitude
+
+# Per-process state for analyze_behavior_parallel workers; flow objects are
+# not picklable, so each worker builds its own processor once.
+_worker_processor = None
+_worker_sample_size = None
+_worker_scale = 1.0
+_worker_rng = None
+
+def _init_analysis_worker(flow_algo: str, dis_preset: str, angle_sample_size: int,
+                          flow_input_scale: float = 1.0):
+    """Pool initializer: cache a flow processor per worker process."""
+    global _worker_processor, _worker_sample_size, _worker_scale, _worker_rng
+    _worker_processor = OpticalFlowProcessor(
+        flow_algo=flow_algo, dis_preset=dis_preset
+    )
+    _worker_sample_size = angle_sample_size
+    _worker_scale = flow_input_scale
+    _worker_rng = np.random.default_rng()
+
+def _analyze_chunk(chunk_files: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Analyze one chunk of consecutive frame files; returns partial results."""
+    speeds = np.empty(len(chunk_files) - 1, dtype=np.float32)
+    angles = None
+
+    prev_gray = _load_gray(chunk_files[0], _worker_scale)
+    heatmap = np.zeros(prev_gray.shape[:2], dtype=np.float32)
+    for j in range(1, len(chunk_files)):
+        gray = _load_gray(chunk_files[j], _worker_scale)
+        avg_speed, sampled_angles, magnitude = _pair_stats(
+            _worker_processor, _worker_sample_size, prev_gray, gray,
+            scale=_worker_scale, rng=_worker_rng
+        )
+        speeds[j - 1] = avg_speed
+        if angles is None:
+            angles = np.empty(
+                (len(chunk_files) - 1, len(sampled_angles)), dtype=np.float32
+            )
+        angles[j - 1] = sampled_angles
+        cv2.add(heatmap, magnitude, dst=heatmap)
+        prev_gray = gray
+
+    return speeds, angles.ravel(), heatmap
+
+class FishBehaviorAnalyzer:
+    """Main class for fish behavior analysis."""
+    
+    def __init__(self, video_path: str, config: Optional[Config] = None):
+        """
+        Initialize fish behavior analyzer.
+        
+        Args:
+            video_path: Path to input video
+            config: Configuration object (uses defaults if None)
+        """
+        self.video_path = video_path
+        self.config = config or Config()
+        
+        # Initialize components
+        self.frame_extractor = FrameExtractor(
+            video_path, 
+            self.config.frame_skip, 
+            self.config.frames_dir
+        )
+        self.flow_processor = OpticalFlowProcessor(
+            self.config.frames_dir,
+            self.config.flow_vis_dir,
+            flow_algo=self.config.flow_params.get('algo', 'dis'),
+            dis_preset=self.config.flow_params.get('dis_preset', 'fast'),
+            downscale=self.config.flow_input_scale
+        )
+        self.visualizer = FlowVisualizer()
+        self.exporter = ResultsExporter(self.config.results_dir)
+        
+        # Cached generator: faster than the mutex-protected legacy global
+        # np.random state on the per-frame sampling path
+        self._rng = np.random.default_rng(0)
+
+        # Analysis results
+        self.analysis_results = {}
+    
+    def extract_frames(self, force_reextract: bool = False) -> int:
+        """Extract frames from video."""
+        return self.frame_extractor.extract_frames(force_reextract)
+    
+    def compute_optical_flow(self, visualize: bool = False, save_vis: bool = True) -> int:
+        """Compute optical flow between frames."""
+        return self.flow_processor.compute_optical_flow(visualize, save_vis)
+    
+    def analyze_behavior(self) -> Dict:
+        """
+        Analyze fish behavior patterns from optical flow.
+        
+        Returns:
+            Dictionary containing analysis results
+        """
+        logger.info("Analyzing fish behavior patterns...")
+
+        frame_files = self.flow_processor._get_frame_files()
+        if len(frame_files) < 2:
+            raise ValueError("Not enough frames for analysis.")
+
+        avg_speeds = np.empty(len(frame_files) - 1, dtype=np.float32)
+        all_angles = None
+
+        scale = self.config.flow_input_scale
+
+        # Prefetch the next frame decode while flow runs on the current pair;
+        # OpenCV releases the GIL during imread so a single worker suffices.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            prev_gray = _load_gray(frame_files[0], scale)
+            heatmap = np.zeros(prev_gray.shape[:2], dtype=np.float32)
+            next_gray = pool.submit(_load_gray, frame_files[1], scale)
+
+            for i in range(1, len(frame_files)):
+                gray = next_gray.result()
+                if i + 1 < len(frame_files):
+                    next_gray = pool.submit(_load_gray, frame_files[i + 1], scale)
+
+                # Analyze this frame pair
+                avg_speed, sampled_angles, magnitude = self._analyze_frame_pair(
+                    prev_gray, gray
+                )
+                avg_speeds[i - 1] = avg_speed
+
+                # Pre-sized float32 rows: one 4-byte slot per sample instead
+                # of boxed Python floats in a growing list
+                if all_angles is None:
+                    all_angles = np.empty(
+                        (len(frame_files) - 1, len(sampled_angles)),
+                        dtype=np.float32
+                    )
+                all_angles[i - 1] = sampled_angles
+
+                # Build heatmap
+                cv2.add(heatmap, magnitude, dst=heatmap)
+
+                prev_gray = gray
+
+        all_angles = all_angles.ravel() if all_angles is not None else np.empty(0, dtype=np.float32)
+        sudden_changes = self._detect_sudden_changes(avg_speeds)
+
+        # Store results
+        self.analysis_results = {
+            'avg_speeds': avg_speeds,
+            'angles': all_angles,
+            'sudden_changes': sudden_changes,
+            'heatmap': heatmap,
+            'metadata': {
+                'video_path': self.video_path,
+                'frame_skip': self.config.frame_skip,
+                'frames_analyzed': len(avg_speeds),
+                'sudden_changes_count': len(sudden_changes)
+            }
+        }
+        
+        logger.info(f"Analysis complete! Found {len(sudden_changes)} sudden changes.")
+        return self.analysis_results
+
+    def analyze_behavior_streaming(self) -> Dict:
+        """
+        Analyze fish behavior by streaming frames straight from the video.
+
+        Unlike analyze_behavior(), this does not require frames extracted to
+        disk: the video is opened directly and frames are skipped with grab()
+        and decoded with retrieve() only when analyzed, so each frame is
+        decoded exactly once and the PNG round-trip is avoided entirely.
+
+        Returns:
+            Dictionary containing analysis results
+        """
+        logger.info("Analyzing fish behavior patterns (streaming)...")
+        return self.analyze_behavior_from_stream(self.frame_extractor.iter_frames())
+
+    def analyze_behavior_from_stream(self, frames: Optional[Iterator[np.ndarray]] = None) -> Dict:
+        """
+        Analyze fish behavior from an iterator of grayscale frames.
+
+        Args:
+            frames: Iterator yielding grayscale frames in order; defaults to
+                streaming the configured video via FrameExtractor.iter_frames()
+
+        Returns:
+            Dictionary containing analysis results
+        """
+        if frames is None:
+            frames = self.frame_extractor.iter_frames()
+
+        avg_speeds = []
+        angle_batches = []
+        heatmap = None
+        prev_gray = None
+        scale = self.config.flow_input_scale
+
+        for gray in frames:
+            gray = _scale_gray(gray, scale)
+            if prev_gray is None:
+                prev_gray = gray
+                heatmap = np.zeros(gray.shape[:2], dtype=np.float32)
+                continue
+
+            # Analyze this frame pair
+            avg_speed, sampled_angles, magnitude = self._analyze_frame_pair(
+                prev_gray, gray
+            )
+            avg_speeds.append(avg_speed)
+            angle_batches.append(sampled_angles)
+
+            # Build heatmap
+            cv2.add(heatmap, magnitude, dst=heatmap)
+
+            prev_gray = gray
+
+        if not avg_speeds:
+            raise ValueError("Not enough frames for analysis.")
+
+        avg_speeds = np.asarray(avg_speeds, dtype=np.float32)
+        all_angles = np.concatenate(angle_batches) if angle_batches else np.empty(0, dtype=np.float32)
+        sudden_changes = self._detect_sudden_changes(avg_speeds)
+
+        # Store results
+        self.analysis_results = {
+            'avg_speeds': avg_speeds,
+            'angles': all_angles,
+            'sudden_changes': sudden_changes,
+            'heatmap': heatmap,
+            'metadata': {
+                'video_path': self.video_path,
+                'frame_skip': self.config.frame_skip,
+                'frames_analyzed': len(avg_speeds),
+                'sudden_changes_count': len(sudden_changes)
+            }
+        }
+
+        logger.info(f"Analysis complete! Found {len(sudden_changes)} sudden changes.")
+        return self.analysis_results
+
+    def _analyze_frame_pair(self, prev_gray: np.ndarray, gray: np.ndarray) -> Tuple:
+        """
+        Compute per-pair flow statistics shared by the analysis loops.
+
+        Args:
+            prev_gray: Previous frame (grayscale)
+            gray: Current frame (grayscale)
+
+        Returns:
+            Tuple of (avg_speed, sampled_angles, magnitude)
+        """
+        return _pair_stats(
+            self.flow_processor, self.config.angle_sample_size, prev_gray, gray,
+            scale=self.config.flow_input_scale, rng=self._rng
+        )
+
+    def _detect_sudden_changes(self, avg_speeds: np.ndarray) -> List[Dict]:
+        """
+        Detect sudden speed changes over the full speed series.
+
+        A single vectorized diff over the array replaces the per-frame
+        Python comparison in the analysis loops.
+
+        Args:
+            avg_speeds: Average speed per analyzed frame pair
+
+        Returns:
+            List of sudden change event dictionaries
+        """
+        diffs = np.abs(np.diff(avg_speeds))
+        hits = np.flatnonzero(diffs > self.config.sudden_change_threshold)
+
+        sudden_changes = []
+        for h in hits:
+            sudden_changes.append({
+                'frame': int(h) + 2,
+                'speed_change': float(diffs[h]),
+                'description': 'Possible snapping/grazing behavior'
+            })
+            logger.info(f"Sudden change detected at frame {int(h) + 2}!")
+        return sudden_changes
+
+    def analyze_behavior_parallel(self, n_workers: Optional[int] = None) -> Dict:
+        """
+        Analyze fish behavior with flow computed across worker processes.
+
+        Frame pairs are split into per-worker chunks overlapping by one frame
+        (the only cross-frame state), partial speeds/angles/heatmaps are
+        reduced after the map, and sudden changes are detected on the
+        concatenated speed series. Scales near-linearly with cores since
+        dense flow is compute-bound.
+
+        Args:
+            n_workers: Number of worker processes (default: os.cpu_count())
+
+        Returns:
+            Dictionary containing analysis results
+        """
+        logger.info("Analyzing fish behavior patterns (parallel)...")
+
+        frame_files = self.flow_processor._get_frame_files()
+        if len(frame_files) < 2:
+            raise ValueError("Not enough frames for analysis.")
+
+        n_pairs = len(frame_files) - 1
+        n_workers = max(1, min(n_workers or os.cpu_count() or 1, n_pairs))
+
+        # Chunk boundaries over pairs; each chunk starts one frame before
+        # its first pair so no pair straddles two workers.
+        bounds = np.linspace(0, n_pairs, n_workers + 1, dtype=int)
+        chunks = [
+            frame_files[bounds[k]:bounds[k + 1] + 1]
+            for k in range(n_workers) if bounds[k + 1] > bounds[k]
+        ]
+
+        # Spawned workers avoid the fork-after-OpenCV-threading deadlock
+        with multiprocessing.get_context('spawn').Pool(
+            len(chunks),
+            initializer=_init_analysis_worker,
+            initargs=(
+                self.config.flow_params.get('algo', 'dis'),
+                self.config.flow_params.get('dis_preset', 'fast'),
+                self.config.angle_sample_size,
+                self.config.flow_input_scale
+            )
+        ) as pool:
+            partials = pool.map(_analyze_chunk, chunks)
+
+        avg_speeds = np.concatenate([p[0] for p in partials])
+        all_angles = np.concatenate([p[1] for p in partials])
+        heatmap = np.sum([p[2] for p in partials], axis=0)
+
+        # Detect sudden changes on the stitched speed series
+        sudden_changes = self._detect_sudden_changes(avg_speeds)
+
+        # Store results
+        self.analysis_results = {
+            'avg_speeds': avg_speeds,
+            'angles': all_angles,
+            'sudden_changes': sudden_changes,
+            'heatmap': heatmap,
+            'metadata': {
+                'video_path': self.video_path,
+                'frame_skip': self.config.frame_skip,
+                'frames_analyzed': len(avg_speeds),
+                'sudden_changes_count': len(sudden_changes)
+            }
+        }
+
+        logger.info(f"Analysis complete! Found {len(sudden_changes)} sudden changes.")
+        return self.analysis_results
+
+    def visualize_results(self, show_plots: bool = True, save_plots: bool = True):
+        """Visualize analysis results."""
+        if not self.analysis_results:
+            raise ValueError("No analysis results available. Run analyze_behavior() first.")
+        
+        self.visualizer.plot_speed_timeline(
+            self.analysis_results['avg_speeds'],
+            show=show_plots,
+            save_path=os.path.join(self.config.results_dir, "speed_timeline.png") if save_plots else None
+        )
+        
+        self.visualizer.plot_direction_histogram(
+            self.analysis_results['angles'],
+            show=show_plots,
+            save_path=os.path.join(self.config.results_dir, "direction_histogram.png") if save_plots else None
+        )
+        
+        self.visualizer.show_movement_heatmap(
+            self.analysis_results['heatmap'],
+            show=show_plots,
+            save_path=os.path.join(self.config.results_dir, "movement_heatmap.png") if save_plots else None
+        )
+    
+    def export_results(self) -> Dict[str, str]:
+        """Export analysis results to files."""
+        if not self.analysis_results:
+            raise ValueError("No analysis results available. Run analyze_behavior() first.")
+        
+        return self.exporter.export_all(self.analysis_results)
+    
+    def run_full_analysis(self, 
+                         force_reextract: bool = False,
+                         visualize_flow: bool = False,
+                         show_plots: bool = True,
+                         save_results: bool = True) -> Dict:
+        """
+        Run complete analysis pipeline.
+        
+        Args:
+            force_reextract: Force frame re-extraction
+            visualize_flow: Show optical flow in real-time
+            show_plots: Display analysis plots
+            save_results: Save all results to disk
+            
+        Returns:
+            Analysis results dictionary
+        """
+        logger.info("Starting full fish behavior analysis pipeline...")
+        
+        # Step 1: Extract frames
+        logger.info("Step 1: Extracting frames...")
+        frame_count = self.extract_frames(force_reextract)
+        logger.info(f"Frame extraction complete. {frame_count} frames available.")
+        
+        # Step 2: Compute optical flow
+        logger.info("Step 2: Computing optical flow...")
+        flow_count = self.compute_optical_flow(visualize_flow, save_results)
+        logger.info(f"Optical flow computation complete. {flow_count} flows computed.")
+        
+        # Step 3: Analyze behavior
+        logger.info("Step 3: Analyzing behavior patterns...")
+        results = self.analyze_behavior()
+        
+        # Step 4: Visualize results
+        logger.info("Step 4: Generating visualizations...")
+        self.visualize_results(show_plots, save_results)
+        
+        # Step 5: Export results
+        if save_results:
+            logger.info("Step 5: Exporting results...")
+            export_paths = self.export_results()
+            logger.info(f"Results exported to: {export_paths}")
+        
+        logger.info("Full analysis pipeline complete!")
         return results
\ No newline at end of file
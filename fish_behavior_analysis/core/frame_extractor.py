@@ -1,88 +1,154 @@
-"""Frame extraction functionality."""
-
-import os
-import cv2
-from typing import Optional
-import logging
-
-logger = logging.getLogger(__name__)
-
-class FrameExtractor:
-    """Handles video frame extraction and management."""
-    
-    def __init__(self, video_path: str, frame_skip: int = 1, frames_dir: str = "frames"):
-        """
-        Initialize frame extractor.
-        
-        Args:
-            video_path: Path to input video file
-            frame_skip: Extract every nth frame (default: 1)
-            frames_dir: Directory to save extracted frames
-        """
-        self.video_path = video_path
-        self.frame_skip = frame_skip
-        self.frames_dir = frames_dir
-        self._validate_video_path()
-    
-    def _validate_video_path(self):
-        """Validate that video file exists."""
-        if not os.path.exists(self.video_path):
-            raise FileNotFoundError(f"Video file not found: {self.video_path}")
-    
-    def extract_frames(self, force_reextract: bool = False) -> int:
-        """
-        Extract frames from video and save as images.
-        
-        Args:
-            force_reextract: Force re-extraction even if frames exist
-            
-        Returns:
-            Number of frames extracted
-        """
-        if not force_reextract and self._frames_exist():
-            logger.info(f"Frames already exist in '{self.frames_dir}'. Skipping extraction.")
-            return len(self._get_existing_frames())
-        
-        os.makedirs(self.frames_dir, exist_ok=True)
-        
-        cap = cv2.VideoCapture(self.video_path)
-        if not cap.isOpened():
-            raise IOError(f"Cannot open video {self.video_path}")
-        
-        frame_idx, saved_count = 0, 0
-        
-        try:
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                    
-                if frame_idx % self.frame_skip == 0:
-                    frame_filename = os.path.join(
-                        self.frames_dir, f"frame_{saved_count:05d}.png"
-                    )
-                    cv2.imwrite(frame_filename, frame)
-                    saved_count += 1
-                    
-                frame_idx += 1
-        finally:
-            cap.release()
-        
-        logger.info(f"Extracted and saved {saved_count} frames in '{self.frames_dir}'.")
-        return saved_count
-    
-    def _frames_exist(self) -> bool:
-        """Check if frames already exist."""
-        if not os.path.exists(self.frames_dir):
-            return False
-        return len(self._get_existing_frames()) > 0
-    
-    def _get_existing_frames(self) -> list:
-        """Get list of existing frame files."""
-        if not os.path.exists(self.frames_dir):
-            return []
-        return [f for f in os.listdir(self.frames_dir) if f.endswith(".png")]
-    
-    def get_frame_count(self) -> int:
-        """Get total number of extracted frames."""
+"""Frame extraction functionality."""
+
+import os
+import cv2
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+class FrameExtractor:
+    """Handles video frame extraction and management."""
+    
+    def __init__(self, video_path: str, frame_skip: int = 1, frames_dir: str = "frames",
+                 grayscale: bool = False):
+        """
+        Initialize frame extractor.
+
+        Args:
+            video_path: Path to input video file
+            frame_skip: Extract every nth frame (default: 1)
+            frames_dir: Directory to save extracted frames
+            grayscale: Save single-channel frames (smaller files, faster
+                decode when downstream analysis only needs grayscale)
+        """
+        self.video_path = video_path
+        self.frame_skip = frame_skip
+        self.frames_dir = frames_dir
+        self.grayscale = grayscale
+        # Cached directory listing; invalidated when extract_frames writes
+        self._cached_frames = None
+        self._validate_video_path()
+    
+    def _validate_video_path(self):
+        """Validate that video file exists."""
+        if not os.path.exists(self.video_path):
+            raise FileNotFoundError(f"Video file not found: {self.video_path}")
+
+    def _open_capture(self) -> cv2.VideoCapture:
+        """
+        Open the video with the FFMPEG backend and a hardware-decode hint.
+
+        Hardware decode (VAAPI/NVDEC/...) offloads H.264/H.265 decoding to
+        dedicated silicon when available; the hint is ignored by backends
+        that don't support it, and we fall back to the default backend if
+        FFMPEG can't open the file.
+        """
+        cap = cv2.VideoCapture(self.video_path, cv2.CAP_FFMPEG)
+        if cap.isOpened():
+            cap.set(cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY)
+        else:
+            cap = cv2.VideoCapture(self.video_path)
+        return cap
+    
+    def extract_frames(self, force_reextract: bool = False) -> int:
+        """
+        Extract frames from video and save as images.
+        
+        Args:
+            force_reextract: Force re-extraction even if frames exist
+            
+        Returns:
+            Number of frames extracted
+        """
+        if not force_reextract and self._frames_exist():
+            logger.info(f"Frames already exist in '{self.frames_dir}'. Skipping extraction.")
+            return len(self._get_existing_frames())
+        
+        os.makedirs(self.frames_dir, exist_ok=True)
+        self._cached_frames = None
+
+        cap = self._open_capture()
+        if not cap.isOpened():
+            raise IOError(f"Cannot open video {self.video_path}")
+        
+        frame_idx, saved_count = 0, 0
+
+        # PNG compression releases the GIL, so writes run on a small pool
+        # while the main thread keeps decoding the next frames.
+        writer_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+
+        try:
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+
+                if frame_idx % self.frame_skip == 0:
+                    frame_filename = os.path.join(
+                        self.frames_dir, f"frame_{saved_count:05d}.png"
+                    )
+                    if self.grayscale:
+                        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                    writer_pool.submit(cv2.imwrite, frame_filename, frame)
+                    saved_count += 1
+
+                frame_idx += 1
+        finally:
+            cap.release()
+            writer_pool.shutdown(wait=True)
+        
+        logger.info(f"Extracted and saved {saved_count} frames in '{self.frames_dir}'.")
+        return saved_count
+    
+    def iter_frames(self) -> Iterator[np.ndarray]:
+        """
+        Yield grayscale frames straight from the video without touching disk.
+
+        Frames are skipped with grab() and only decoded with retrieve() when
+        kept, so skipped frames cost no decode work. This avoids the PNG
+        encode/decode round-trip entirely for single-pass analyses.
+
+        Yields:
+            Grayscale frame arrays in video order
+        """
+        cap = self._open_capture()
+        if not cap.isOpened():
+            raise IOError(f"Cannot open video {self.video_path}")
+
+        frame_idx = 0
+        try:
+            while cap.grab():
+                if frame_idx % self.frame_skip == 0:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    yield cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                frame_idx += 1
+        finally:
+            cap.release()
+
+    def _frames_exist(self) -> bool:
+        """Check if frames already exist."""
+        if not os.path.exists(self.frames_dir):
+            return False
+        return len(self._get_existing_frames()) > 0
+    
+    def _get_existing_frames(self) -> list:
+        """Get sorted list of existing frame files (cached between scans)."""
+        if self._cached_frames is not None:
+            return self._cached_frames
+        if not os.path.exists(self.frames_dir):
+            return []
+        # scandir avoids the per-entry stat overhead of listdir-based checks
+        self._cached_frames = sorted(
+            entry.name for entry in os.scandir(self.frames_dir)
+            if entry.name.endswith(".png")
+        )
+        return self._cached_frames
+    
+    def get_frame_count(self) -> int:
+        """Get total number of extracted frames."""
         return len(self._get_existing_frames())
\ No newline at end of file
@@ -44,4 +44,19 @@ class TestFishBehaviorAnalyzer:
         
         with patch.object(analyzer.flow_processor, '_get_frame_files', return_value=[]):
             with pytest.raises(ValueError, match="Not enough frames"):
-                analyzer.analyze_behavior()
\ No newline at end of file
+                analyzer.analyze_behavior()
+
+    @patch('cv2.VideoCapture')
+    @patch('os.path.exists')
+    def test_analyze_behavior_streaming_with_unreadable_video(self, mock_exists, mock_cap):
+        """Test streaming analysis with a video that cannot be opened."""
+        mock_exists.return_value = True
+
+        mock_cap_instance = MagicMock()
+        mock_cap.return_value = mock_cap_instance
+        mock_cap_instance.isOpened.return_value = False
+
+        analyzer = FishBehaviorAnalyzer("test_video.mp4")
+
+        with pytest.raises(IOError, match="Cannot open video"):
+            analyzer.analyze_behavior_streaming()
\ No newline at end of file
@@ -50,6 +50,10 @@ setup(
             "sphinx>=3.0",
             "sphinx-rtd-theme>=0.5",
         ],
+        "perf": [
+            "orjson>=3.8",
+            "numba>=0.56",
+        ],
     },
     entry_points={
         "console_scripts": [